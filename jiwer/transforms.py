@@ -25,6 +25,7 @@ import sys
 import re
 import string
 import unicodedata
+import functools
 
 from typing import Union, List, Mapping
 
@@ -49,6 +50,48 @@ __all__ = [
 ]
 
 
+# definitely a non exhaustive list of contractions
+_CONTRACTIONS = {
+    # specific words
+    "won't": "will not",
+    "can't": "can not",
+    "let's": "let us",
+    # general attachments
+    "n't": " not",
+    "'re": " are",
+    "'s": " is",
+    "'d": " would",
+    "'ll": " will",
+    "'t": " not",
+    "'ve": " have",
+    "'m": " am",
+}
+
+# a single alternation, longest contraction first, such that e.g. `won't` takes
+# precedence over `n't` and `'t`
+_CONTRACTION_PATTERN = re.compile(
+    "|".join(re.escape(c) for c in sorted(_CONTRACTIONS, key=len, reverse=True))
+)
+
+_MULTIPLE_SPACES_PATTERN = re.compile(r"\s\s+")
+
+# kaldi non-words such as `<unk>` or `[laugh]`
+_KALDI_NON_WORDS_PATTERN = re.compile(r"[<\[][^>\]]*[>\]]")
+
+
+@functools.lru_cache(maxsize=None)
+def _punctuation_characters() -> str:
+    """
+    All unicode characters whose category name starts with `P`. Scanning the
+    whole unicode table is expensive, so this is only done once.
+    """
+    codepoints = range(sys.maxunicode + 1)
+
+    return "".join(
+        chr(i) for i in codepoints if unicodedata.category(chr(i)).startswith("P")
+    )
+
+
 class AbstractTransform(object):
     def __call__(self, sentences: Union[str, List[str]]):
         if isinstance(sentences, str):
@@ -75,6 +118,17 @@ class Compose(object):
 
     def __call__(self, text):
         for tr in self.transforms:
+            # dispatch directly on the type of the (intermediate) input instead of
+            # going through `AbstractTransform.__call__` for every transform,
+            # unless a transform overrides `__call__` itself
+            if type(tr).__call__ is AbstractTransform.__call__:
+                if type(text) is str:
+                    text = tr.process_string(text)
+                    continue
+                elif type(text) is list:
+                    text = tr.process_list(text)
+                    continue
+
             text = tr(text)
 
         return text
@@ -85,11 +139,27 @@ class BaseRemoveTransform(AbstractTransform):
         self.tokens_to_remove = tokens_to_remove
         self.replace_token = replace_token
 
+        # empty tokens would match at every position of the string
+        tokens = [t for t in tokens_to_remove if len(t) > 0]
+
+        # when only single characters need to be replaced, a translation table
+        # can do all replacements in a single pass over the string
+        if all(len(t) == 1 for t in tokens):
+            self._table = str.maketrans(dict.fromkeys(tokens, replace_token))
+            self._pattern = None
+        else:
+            # otherwise, replace all tokens in a single pass, preferring the
+            # longest token when multiple tokens start at the same position
+            tokens = sorted(tokens, key=len, reverse=True)
+            self._table = None
+            self._pattern = re.compile("|".join(re.escape(t) for t in tokens))
+            self._replacement = replace_token.replace("\\", "\\\\")
+
     def process_string(self, s: str):
-        for w in self.tokens_to_remove:
-            s = s.replace(w, self.replace_token)
+        if self._table is not None:
+            return s.translate(self._table)
 
-        return s
+        return self._pattern.sub(self._replacement, s)
 
     def process_list(self, inp: List[str]):
         return [self.process_string(s) for s in inp]
@@ -112,16 +182,15 @@ class ReduceToListOfListOfWords(AbstractTransform):
         """
         self.word_delimiter = word_delimiter
 
+    def _tokenize(self, s: str) -> List[str]:
+        # note that `s.split()` would also split on other whitespace characters
+        return list(filter(None, s.split(self.word_delimiter)))
+
     def process_string(self, s: str):
-        return [[w for w in s.split(self.word_delimiter) if len(w) >= 1]]
+        return [self._tokenize(s)]
 
     def process_list(self, inp: List[str]):
-        sentence_collection = []
-
-        for sentence in inp:
-            list_of_words = self.process_string(sentence)[0]
-
-            sentence_collection.append(list_of_words)
+        sentence_collection = [self._tokenize(sentence) for sentence in inp]
 
         if len(sentence_collection) == 0:
             return [[]]
@@ -131,15 +200,10 @@ class ReduceToListOfListOfWords(AbstractTransform):
 
 class ReduceToListOfListOfChars(AbstractTransform):
     def process_string(self, s: str):
-        return [[w for w in s]]
+        return [list(s)]
 
     def process_list(self, inp: List[str]):
-        sentence_collection = []
-
-        for sentence in inp:
-            list_of_words = self.process_string(sentence)[0]
-
-            sentence_collection.append(list_of_words)
+        sentence_collection = [list(sentence) for sentence in inp]
 
         if len(sentence_collection) == 0:
             return [[]]
@@ -176,9 +240,13 @@ class SubstituteRegexes(AbstractTransform):
     def __init__(self, substitutions: Mapping[str, str]):
         self.substitutions = substitutions
 
+        self._patterns = [
+            (re.compile(key), value) for key, value in substitutions.items()
+        ]
+
     def process_string(self, s: str):
-        for key, value in self.substitutions.items():
-            s = re.sub(key, value, s)
+        for pattern, value in self._patterns:
+            s = pattern.sub(value, s)
 
         return s
 
@@ -187,11 +255,20 @@ class SubstituteWords(AbstractTransform):
     def __init__(self, substitutions: Mapping[str, str]):
         self.substitutions = substitutions
 
+        # match every word in a single pass, preferring the longest word when
+        # multiple words start at the same position
+        words = sorted(substitutions, key=len, reverse=True)
+        self._pattern = (
+            re.compile(r"\b({})\b".format("|".join(re.escape(w) for w in words)))
+            if len(words) > 0
+            else None
+        )
+
     def process_string(self, s: str):
-        for key, value in self.substitutions.items():
-            s = re.sub(r"\b{}\b".format(re.escape(key)), value, s)
+        if self._pattern is None:
+            return s
 
-        return s
+        return self._pattern.sub(lambda m: self.substitutions[m.group(0)], s)
 
 
 class RemoveSpecificWords(SubstituteWords):
@@ -215,17 +292,12 @@ class RemoveWhiteSpace(BaseRemoveTransform):
 
 class RemovePunctuation(BaseRemoveTransform):
     def __init__(self):
-        codepoints = range(sys.maxunicode + 1)
-        punctuation = set(
-            chr(i) for i in codepoints if unicodedata.category(chr(i)).startswith("P")
-        )
-
-        super().__init__(list(punctuation))
+        super().__init__(list(_punctuation_characters()))
 
 
 class RemoveMultipleSpaces(AbstractTransform):
     def process_string(self, s: str):
-        return re.sub(r"\s\s+", " ", s)
+        return _MULTIPLE_SPACES_PATTERN.sub(" ", s)
 
     def process_list(self, inp: List[str]):
         return [self.process_string(s) for s in inp]
@@ -241,41 +313,38 @@ class RemoveEmptyStrings(AbstractTransform):
         return s.strip()
 
     def process_list(self, inp: List[str]):
-        return [s for s in inp if self.process_string(s) != ""]
+        return [s for s in inp if s.strip()]
 
 
 class ExpandCommonEnglishContractions(AbstractTransform):
     def process_string(self, s: str):
-        # definitely a non exhaustive list
-
-        # specific words
-        s = re.sub(r"won't", "will not", s)
-        s = re.sub(r"can\'t", "can not", s)
-        s = re.sub(r"let\'s", "let us", s)
-
-        # general attachments
-        s = re.sub(r"n\'t", " not", s)
-        s = re.sub(r"\'re", " are", s)
-        s = re.sub(r"\'s", " is", s)
-        s = re.sub(r"\'d", " would", s)
-        s = re.sub(r"\'ll", " will", s)
-        s = re.sub(r"\'t", " not", s)
-        s = re.sub(r"\'ve", " have", s)
-        s = re.sub(r"\'m", " am", s)
-
-        return s
+        return _CONTRACTION_PATTERN.sub(lambda m: _CONTRACTIONS[m.group(0)], s)
 
 
 class ToLowerCase(AbstractTransform):
     def process_string(self, s: str):
         return s.lower()
 
+    def process_list(self, inp: List[str]):
+        # subclasses might override `process_string`
+        if type(self).process_string is not ToLowerCase.process_string:
+            return super().process_list(inp)
+
+        return list(map(str.lower, inp))
+
 
 class ToUpperCase(AbstractTransform):
     def process_string(self, s: str):
         return s.upper()
 
+    def process_list(self, inp: List[str]):
+        # subclasses might override `process_string`
+        if type(self).process_string is not ToUpperCase.process_string:
+            return super().process_list(inp)
+
+        return list(map(str.upper, inp))
+
 
 class RemoveKaldiNonWords(AbstractTransform):
     def process_string(self, s: str):
-        return re.sub(r"[<\[][^>\]]*[>\]]", "", s)
+        return _KALDI_NON_WORDS_PATTERN.sub("", s)
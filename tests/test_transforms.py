@@ -1,7 +1,7 @@
 import unittest
 
 from jiwer.transforms import *
-from jiwer.transforms import ReduceToListOfListOfChars
+from jiwer.transforms import ReduceToListOfListOfChars, BaseRemoveTransform
 
 
 def _apply_test_on(self: unittest.TestCase, tr, cases):
@@ -9,6 +9,58 @@ def _apply_test_on(self: unittest.TestCase, tr, cases):
         self.assertEqual(outp, tr(inp))
 
 
+class TestCompose(unittest.TestCase):
+    def test_normal(self):
+        cases = [
+            ("  this is   a test ", [["this", "is", "a", "test"]]),
+            (["this  is one ", " is two"], [["this", "is", "one"], ["is", "two"]]),
+            ("", [[]]),
+            ([], [[]]),
+        ]
+
+        _apply_test_on(
+            self,
+            Compose(
+                [
+                    Compose([RemoveMultipleSpaces(), Strip()]),
+                    ReduceToListOfListOfWords(),
+                ]
+            ),
+            cases,
+        )
+
+    def test_empty_intermediate(self):
+        cases = [
+            ("   ", [[]]),
+            ([" ", ""], [[]]),
+        ]
+
+        _apply_test_on(
+            self,
+            Compose([Strip(), RemoveEmptyStrings(), ReduceToListOfListOfWords()]),
+            cases,
+        )
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            Compose([Strip(), ReduceToListOfListOfWords()])(("a", "b"))
+
+    def test_overridden_call(self):
+        class AlwaysCalled(AbstractTransform):
+            def __call__(self, sentences):
+                return "called"
+
+            def process_string(self, s: str):
+                return s
+
+        cases = [
+            ("x", "called"),
+            (["x"], "called"),
+        ]
+
+        _apply_test_on(self, Compose([AlwaysCalled()]), cases)
+
+
 class TestReduceToSingleSentence(unittest.TestCase):
     def test_normal(self):
         cases = [
@@ -37,6 +89,7 @@ class TestReduceToListOfListOfWords(unittest.TestCase):
     def test_normal(self):
         cases = [
             ("this is a test", [["this", "is", "a", "test"]]),
+            ("this  is\ta test ", [["this", "is\ta", "test"]]),
             ("", [[]]),
             (["this is one", "is two"], [["this", "is", "one"], ["is", "two"]]),
             (
@@ -189,6 +242,49 @@ class TestRemoveSpecificWords(unittest.TestCase):
             self, RemoveSpecificWords(["yhe", "yeah", "a", "he", "the"]), cases
         )
 
+    def test_multiple_words(self):
+        cases = [
+            (["a b    b"], ["     b"]),
+            (["a c"], ["  c"]),
+        ]
+
+        _apply_test_on(self, RemoveSpecificWords(["a", "a b"]), cases)
+
+
+class TestBaseRemoveTransform(unittest.TestCase):
+    def test_multiple_characters(self):
+        cases = [
+            (["um so uhm this is it"], ["_ so _ this is it"]),
+            (["uhmm"], ["_m"]),
+            (["no filler"], ["no filler"]),
+        ]
+
+        _apply_test_on(self, BaseRemoveTransform(["um", "uhm"], "_"), cases)
+
+    def test_replace_token(self):
+        cases = [
+            (["a.b"], ["a\\1b"]),
+            (["a--b"], ["a\\1\\1b"]),
+        ]
+
+        _apply_test_on(self, BaseRemoveTransform([".", "-"], "\\1"), cases)
+
+        cases = [
+            (["a.b"], ["a\\1b"]),
+            (["a--b"], ["a\\1b"]),
+        ]
+
+        _apply_test_on(self, BaseRemoveTransform([".", "--"], "\\1"), cases)
+
+    def test_no_tokens(self):
+        cases = [
+            (["abc"], ["abc"]),
+            ([""], [""]),
+        ]
+
+        _apply_test_on(self, BaseRemoveTransform([], "xx"), cases)
+        _apply_test_on(self, BaseRemoveTransform([""], "xx"), cases)
+
 
 class TestRemoveWhiteSpace(unittest.TestCase):
     def test_normal(self):
@@ -257,6 +353,32 @@ class TestSubstituteWords(unittest.TestCase):
             cases,
         )
 
+    def test_overlapping_words(self):
+        cases = [
+            (["foo bar baz"], ["qux baz"]),
+            (["foo baz"], ["quux baz"]),
+        ]
+
+        _apply_test_on(
+            self,
+            SubstituteWords({"foo": "quux", "foo bar": "qux"}),
+            cases,
+        )
+
+    def test_empty(self):
+        cases = [
+            (["you're pretty"], ["you're pretty"]),
+        ]
+
+        _apply_test_on(self, SubstituteWords({}), cases)
+
+    def test_literal_substitution(self):
+        cases = [
+            (["a b c"], ["\\n \\1 c"]),
+        ]
+
+        _apply_test_on(self, SubstituteWords({"a": r"\n", "b": r"\1"}), cases)
+
 
 class TestSubstituteRegexes(unittest.TestCase):
     def test_normal(self):
@@ -305,6 +427,24 @@ class TestExpandCommonEnglishContractions(unittest.TestCase):
                 ["she will make sure you can not make it"],
             ),
             (["let's party!"], ["let us party!"]),
+            (["i won't go"], ["i will not go"]),
+            (["don't"], ["do not"]),
+            (["it's"], ["it is"]),
+            (["I'm"], ["I am"]),
+            (["we've"], ["we have"]),
+            (["they're"], ["they are"]),
+            (["he'd"], ["he would"]),
+            (["ain't"], ["ai not"]),
+            (["'t"], [" not"]),
+        ]
+
+        _apply_test_on(self, ExpandCommonEnglishContractions(), cases)
+
+    def test_leftmost_first(self):
+        # contractions are expanded in a single pass, so a contraction which
+        # starts earlier takes precedence over an overlapping one
+        cases = [
+            (["'llet's"], [" willet is"]),
         ]
 
         _apply_test_on(self, ExpandCommonEnglishContractions(), cases)
@@ -318,6 +458,26 @@ class TestToLowerCase(unittest.TestCase):
 
         _apply_test_on(self, ToLowerCase(), cases)
 
+    def test_list(self):
+        cases = [
+            (["You're PRETTY", "A"], ["you're pretty", "a"]),
+            ([], []),
+        ]
+
+        _apply_test_on(self, ToLowerCase(), cases)
+
+    def test_overridden_process_string(self):
+        class Exclaim(ToLowerCase):
+            def process_string(self, s: str):
+                return super().process_string(s) + "!"
+
+        cases = [
+            ("A", "a!"),
+            (["A", "A"], ["a!", "a!"]),
+        ]
+
+        _apply_test_on(self, Exclaim(), cases)
+
 
 class TestToUpperCase(unittest.TestCase):
     def test_normal(self):
@@ -327,6 +487,26 @@ class TestToUpperCase(unittest.TestCase):
 
         _apply_test_on(self, ToUpperCase(), cases)
 
+    def test_list(self):
+        cases = [
+            (["You're amazing", "a"], ["YOU'RE AMAZING", "A"]),
+            ([], []),
+        ]
+
+        _apply_test_on(self, ToUpperCase(), cases)
+
+    def test_overridden_process_string(self):
+        class Exclaim(ToUpperCase):
+            def process_string(self, s: str):
+                return super().process_string(s) + "!"
+
+        cases = [
+            ("a", "A!"),
+            (["a", "a"], ["A!", "A!"]),
+        ]
+
+        _apply_test_on(self, Exclaim(), cases)
+
 
 class TestRemoveKaldiNonWords(unittest.TestCase):
     def test_normal(self):